@@ -5,9 +5,14 @@ A comprehensive alarm clock with customizable tones and snooze functionality.
 
 import time
 import datetime
-import threading
+import functools
+import heapq
+import json
 import os
+import re
+import select
 import sys
+import wave
 from typing import Optional, List, Dict
 
 # Try to import playsound, with fallback options
@@ -20,6 +25,21 @@ except ImportError:
     def playsound(sound_file):
         print(f"♪ Playing alarm sound: {sound_file} ♪")
 
+# Prefer simpleaudio for low-latency playback of preloaded PCM buffers
+try:
+    import simpleaudio
+    SIMPLEAUDIO_AVAILABLE = True
+except ImportError:
+    SIMPLEAUDIO_AVAILABLE = False
+
+# Matches valid 24-hour HH:MM times so validation is a single C-level match
+_TIME_RE = re.compile(r'^([01]\d|2[0-3]):([0-5]\d)$')
+
+@functools.lru_cache(maxsize=256)
+def _cached_exists(path: str) -> bool:
+    """Memoized os.path.exists to avoid repeated stat syscalls."""
+    return os.path.exists(path)
+
 class AlarmClock:
     """Main alarm clock class with full functionality."""
     
@@ -27,50 +47,78 @@ class AlarmClock:
         """Initialize the alarm clock with default settings."""
         self.alarms: List[Dict] = []
         self.active_alarm: Optional[Dict] = None
+        # Running count of enabled alarms so the menu doesn't rescan
+        self._active_count = 0
         self.snooze_duration = 5  # Default snooze duration in minutes
         self.default_tones = {
             "1": "beep.wav",
-            "2": "bell.wav", 
+            "2": "bell.wav",
             "3": "chime.wav",
             "4": "buzzer.wav"
         }
+        # Pre-joined paths so tone selection never re-runs os.path.join
+        self._tone_paths = {choice: os.path.join("alarm_tones", name)
+                            for choice, name in self.default_tones.items()}
         self.running = True
-        
-        # Create default tone files if they don't exist
-        self._create_default_tones()
-    
-    def _create_default_tones(self):
-        """Create placeholder sound files for demonstration purposes."""
-        tone_folder = "alarm_tones"
-        if not os.path.exists(tone_folder):
-            os.makedirs(tone_folder)
-        
-        # Create simple text files as placeholders for actual audio files
-        for tone_file in self.default_tones.values():
-            tone_path = os.path.join(tone_folder, tone_file)
-            if not os.path.exists(tone_path):
-                with open(tone_path, 'w') as f:
-                    f.write(f"Placeholder for {tone_file}")
+
+        # Min-heap of (next_fire_epoch, alarm_id) so the scheduler only
+        # inspects the earliest deadline; stale entries are skipped lazily.
+        self._heap: List[tuple] = []
+        self._alarms_by_id: Dict[int, Dict] = {}
+        self._next_alarm_id = 1
+
+        # Restore alarms persisted by a previous run
+        self._state_path = ".alarms.json"
+        self._load()
     
-    def validate_time_format(self, time_str: str) -> bool:
+    def _load(self) -> None:
+        """Load persisted alarms from disk and warm-start the scheduler."""
+        try:
+            with open(self._state_path) as f:
+                self.alarms = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+
+        for alarm in self.alarms:
+            # Rebuild the derived runtime fields that _save strips out
+            hours, minutes = (int(part) for part in alarm['time'].split(':'))
+            alarm['_hm'] = (hours, minutes)
+            alarm['_tone_name'] = os.path.basename(alarm['tone'])
+            alarm['_pcm'] = self._preload(alarm['tone'])
+            # Snooze deadlines don't survive a restart; fall back to the
+            # alarm's regular schedule
+            alarm['snoozed'] = False
+
+            self._alarms_by_id[alarm['id']] = alarm
+            self._next_alarm_id = max(self._next_alarm_id, alarm['id'] + 1)
+            if alarm['enabled']:
+                self._active_count += 1
+                self._schedule(alarm)
+
+    def _save(self) -> None:
+        """Persist alarms to disk, written atomically via os.replace."""
+        serializable = [{key: value for key, value in alarm.items()
+                         if not key.startswith('_')}
+                        for alarm in self.alarms]
+        tmp_path = self._state_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(serializable, f, indent=2)
+        os.replace(tmp_path, self._state_path)
+
+    def validate_time_format(self, time_str: str) -> Optional[tuple]:
         """
         Validate time input in HH:MM format (24-hour clock).
-        
+
         Args:
             time_str: Time string to validate
-            
+
         Returns:
-            bool: True if valid, False otherwise
+            Optional[tuple]: Parsed (hours, minutes) if valid, None otherwise
         """
-        try:
-            time_parts = time_str.split(':')
-            if len(time_parts) != 2:
-                return False
-            
-            hours, minutes = int(time_parts[0]), int(time_parts[1])
-            return 0 <= hours <= 23 and 0 <= minutes <= 59
-        except (ValueError, IndexError):
-            return False
+        match = _TIME_RE.match(time_str)
+        if match:
+            return (int(match.group(1)), int(match.group(2)))
+        return None
     
     def set_alarm(self) -> None:
         """Set a new alarm with user input."""
@@ -81,12 +129,14 @@ class AlarmClock:
         # Get alarm time
         while True:
             alarm_time = input("Enter alarm time (HH:MM in 24-hour format): ").strip()
-            if self.validate_time_format(alarm_time):
+            parsed_hm = self.validate_time_format(alarm_time)
+            if parsed_hm:
                 break
             print("❌ Invalid time format. Please use HH:MM (e.g., 14:30)")
         
-        # Get alarm tone
+        # Get alarm tone and decode it up front so ring time stays I/O-free
         tone_choice = self.select_alarm_tone()
+        tone_pcm = self._preload(tone_choice)
         
         # Get snooze duration
         snooze_duration = self.select_snooze_duration()
@@ -98,16 +148,25 @@ class AlarmClock:
         
         # Create alarm dictionary
         alarm = {
+            'id': self._next_alarm_id,
             'time': alarm_time,
+            '_hm': parsed_hm,
             'tone': tone_choice,
+            '_tone_name': os.path.basename(tone_choice),
+            '_pcm': tone_pcm,
             'snooze_duration': snooze_duration,
             'label': label,
             'enabled': True,
             'snoozed': False,
             'snooze_count': 0
         }
-        
+        self._next_alarm_id += 1
+
         self.alarms.append(alarm)
+        self._alarms_by_id[alarm['id']] = alarm
+        self._active_count += 1
+        self._schedule(alarm)
+        self._save()
         print(f"\n✅ Alarm set successfully!")
         print(f"   Time: {alarm_time}")
         print(f"   Tone: {tone_choice}")
@@ -131,9 +190,8 @@ class AlarmClock:
         while True:
             choice = input("Enter your choice (1-5): ").strip()
             
-            if choice in ['1', '2', '3', '4']:
-                tone_file = self.default_tones[choice]
-                return os.path.join("alarm_tones", tone_file)
+            if choice in self._tone_paths:
+                return self._tone_paths[choice]
             elif choice == '5':
                 return self.upload_custom_tone()
             else:
@@ -149,6 +207,8 @@ class AlarmClock:
         while True:
             file_path = input("Enter path to custom audio file (.wav, .mp3): ").strip()
             
+            # Plain os.path.exists: the user may create the file between
+            # retries, so a cached negative answer would wedge this loop
             if os.path.exists(file_path):
                 # Check if it's an audio file
                 if file_path.lower().endswith(('.wav', '.mp3', '.ogg', '.m4a')):
@@ -162,7 +222,7 @@ class AlarmClock:
                 # Offer to use default instead
                 use_default = input("Use default tone instead? (y/n): ").lower()
                 if use_default == 'y':
-                    return os.path.join("alarm_tones", self.default_tones['1'])
+                    return self._tone_paths['1']
     
     def select_snooze_duration(self) -> int:
         """
@@ -201,23 +261,25 @@ class AlarmClock:
     
     def view_alarms(self) -> None:
         """Display all set alarms."""
-        print("\n" + "="*50)
-        print("           YOUR ALARMS")
-        print("="*50)
-        
+        lines = ["\n" + "="*50,
+                 "           YOUR ALARMS",
+                 "="*50]
+
         if not self.alarms:
-            print("No alarms set. Use option 1 to set an alarm.")
-            return
-        
-        for i, alarm in enumerate(self.alarms, 1):
-            status = "✅ ENABLED" if alarm['enabled'] else "❌ DISABLED"
-            snooze_info = f" (Snoozed {alarm['snooze_count']}x)" if alarm['snoozed'] else ""
-            
-            print(f"{i}. {alarm['label']}")
-            print(f"   Time: {alarm['time']} | Status: {status}{snooze_info}")
-            print(f"   Tone: {os.path.basename(alarm['tone'])}")
-            print(f"   Snooze: {alarm['snooze_duration']} minutes")
-            print("-" * 40)
+            lines.append("No alarms set. Use option 1 to set an alarm.")
+        else:
+            for i, alarm in enumerate(self.alarms, 1):
+                status = "✅ ENABLED" if alarm['enabled'] else "❌ DISABLED"
+                snooze_info = f" (Snoozed {alarm['snooze_count']}x)" if alarm['snoozed'] else ""
+
+                lines.append(f"{i}. {alarm['label']}")
+                lines.append(f"   Time: {alarm['time']} | Status: {status}{snooze_info}")
+                lines.append(f"   Tone: {alarm['_tone_name']}")
+                lines.append(f"   Snooze: {alarm['snooze_duration']} minutes")
+                lines.append("-" * 40)
+
+        # One write syscall for the whole listing
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def manage_alarms(self) -> None:
         """Manage existing alarms (enable/disable/delete)."""
@@ -248,8 +310,18 @@ class AlarmClock:
         try:
             alarm_num = int(input("Enter alarm number to toggle: ")) - 1
             if 0 <= alarm_num < len(self.alarms):
-                self.alarms[alarm_num]['enabled'] = not self.alarms[alarm_num]['enabled']
-                status = "enabled" if self.alarms[alarm_num]['enabled'] else "disabled"
+                alarm = self.alarms[alarm_num]
+                alarm['enabled'] = not alarm['enabled']
+                if alarm['enabled']:
+                    self._active_count += 1
+                    self._schedule(alarm)
+                else:
+                    self._active_count -= 1
+                    # Leave the heap entry in place as a tombstone; the
+                    # scheduler skips it lazily on the next pop.
+                    alarm.pop('_next_fire', None)
+                self._save()
+                status = "enabled" if alarm['enabled'] else "disabled"
                 print(f"✅ Alarm {alarm_num + 1} {status}.")
             else:
                 print("❌ Invalid alarm number.")
@@ -262,24 +334,57 @@ class AlarmClock:
             alarm_num = int(input("Enter alarm number to delete: ")) - 1
             if 0 <= alarm_num < len(self.alarms):
                 deleted_alarm = self.alarms.pop(alarm_num)
+                self._alarms_by_id.pop(deleted_alarm['id'], None)
+                if deleted_alarm['enabled']:
+                    self._active_count -= 1
+                self._save()
                 print(f"✅ Alarm '{deleted_alarm['label']}' deleted.")
             else:
                 print("❌ Invalid alarm number.")
         except ValueError:
             print("❌ Please enter a valid number.")
     
+    def _preload(self, tone_path: str) -> Optional[tuple]:
+        """
+        Decode a WAV tone into an in-memory PCM buffer.
+
+        Args:
+            tone_path: Path to the tone file
+
+        Returns:
+            Optional[tuple]: (frames, framerate, channels, sample_width),
+            or None if the file isn't a decodable WAV
+        """
+        if not tone_path.lower().endswith('.wav'):
+            return None
+
+        try:
+            with wave.open(tone_path, 'rb') as wav:
+                return (wav.readframes(wav.getnframes()), wav.getframerate(),
+                        wav.getnchannels(), wav.getsampwidth())
+        except (OSError, EOFError, wave.Error):
+            return None
+
     def play_alarm(self, alarm: Dict) -> None:
         """
         Play the alarm sound.
-        
+
         Args:
             alarm: Alarm dictionary containing tone information
         """
         try:
             print(f"\n🚨 ALARM RINGING: {alarm['label']} 🚨")
             print(f"Time: {alarm['time']}")
-            
-            if AUDIO_AVAILABLE and os.path.exists(alarm['tone']):
+
+            pcm = alarm.get('_pcm')
+            if SIMPLEAUDIO_AVAILABLE and pcm:
+                # Play straight from the preloaded buffer: no file open or
+                # decode on the ringing path
+                frames, framerate, channels, sample_width = pcm
+                playback = simpleaudio.play_buffer(frames, channels,
+                                                   sample_width, framerate)
+                playback.wait_done()
+            elif AUDIO_AVAILABLE and _cached_exists(alarm['tone']):
                 playsound(alarm['tone'])
             else:
                 # Simulate alarm sound for demonstration
@@ -292,36 +397,78 @@ class AlarmClock:
             # Fallback to text-based alarm
             print("🔔 ALARM! ALARM! ALARM! 🔔")
     
-    def handle_alarm_response(self, alarm: Dict) -> None:
+    def _input_with_timeout(self, prompt: str, timeout: float) -> str:
         """
-        Handle user response to alarm (dismiss or snooze).
-        
+        Read a line from stdin, returning '' if nothing arrives in time.
+
         Args:
-            alarm: The alarm that's currently ringing
+            prompt: Prompt to display
+            timeout: Seconds to wait for input
+
+        Returns:
+            str: The stripped input line, or '' on timeout
         """
-        self.active_alarm = alarm
-        
+        print(prompt, end='', flush=True)
+
+        if os.name == 'nt':
+            # select() doesn't work on Windows console handles; poll the
+            # keyboard buffer instead
+            import msvcrt
+            deadline = time.time() + timeout
+            chars = []
+            while time.time() < deadline:
+                if msvcrt.kbhit():
+                    char = msvcrt.getwche()
+                    if char in ('\r', '\n'):
+                        print()
+                        return ''.join(chars).strip()
+                    chars.append(char)
+                else:
+                    time.sleep(0.05)
+            print()
+            return ''
+
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        if ready:
+            return sys.stdin.readline().strip()
+        print()
+        return ''
+
+    def handle_alarm_response(self, alarms: List[Dict]) -> None:
+        """
+        Handle user response to ringing alarms (dismiss or snooze).
+
+        Args:
+            alarms: The alarms that are currently ringing together
+        """
+        label = " + ".join(alarm['label'] for alarm in alarms)
+        self.active_alarm = alarms[0]
+
         while self.active_alarm:
-            print(f"\n⏰ Alarm: {alarm['label']}")
+            print(f"\n⏰ Alarm: {label}")
             print("1. Dismiss Alarm")
             print("2. Snooze Alarm")
-            
+
             try:
                 # Give user 30 seconds to respond, then auto-snooze
-                response = input("Enter your choice (1-2) or press Enter to snooze: ").strip()
-                
+                response = self._input_with_timeout(
+                    "Enter your choice (1-2) or press Enter to snooze: ", 30)
+
                 if response == '1' or response.lower() == 'dismiss':
                     print("✅ Alarm dismissed.")
-                    alarm['snoozed'] = False
-                    alarm['snooze_count'] = 0
+                    for alarm in alarms:
+                        alarm['snoozed'] = False
+                        alarm['snooze_count'] = 0
+                    self._save()
                     self.active_alarm = None
                     break
                 elif response == '2' or response == '' or response.lower() == 'snooze':
-                    self.snooze_alarm(alarm)
+                    for alarm in alarms:
+                        self.snooze_alarm(alarm)
                     break
                 else:
                     print("❌ Invalid choice. Please enter 1 or 2.")
-                    
+
             except KeyboardInterrupt:
                 print("\n✅ Alarm dismissed via keyboard interrupt.")
                 self.active_alarm = None
@@ -337,71 +484,127 @@ class AlarmClock:
         alarm['snoozed'] = True
         alarm['snooze_count'] += 1
         snooze_minutes = alarm['snooze_duration']
-        
+
         print(f"😴 Alarm snoozed for {snooze_minutes} minutes.")
         print(f"   Snooze count: {alarm['snooze_count']}")
-        
-        # Calculate new alarm time
-        current_time = datetime.datetime.now()
-        snooze_time = current_time + datetime.timedelta(minutes=snooze_minutes)
-        new_alarm_time = snooze_time.strftime("%H:%M")
-        
-        # Create a temporary snooze alarm
-        snooze_alarm = alarm.copy()
-        snooze_alarm['time'] = new_alarm_time
-        snooze_alarm['label'] = f"{alarm['label']} (Snooze {alarm['snooze_count']})"
-        
+
+        # Reschedule on the shared heap; the event loop handles snoozes
+        # the same way as regular alarms.
+        epoch = time.time() + snooze_minutes * 60
+        alarm['_next_fire'] = epoch
+        heapq.heappush(self._heap, (epoch, alarm['id']))
+
         self.active_alarm = None
-        
-        # Start monitoring for the snoozed alarm
-        threading.Thread(target=self.monitor_snooze_alarm, args=(snooze_alarm,), daemon=True).start()
-    
-    def monitor_snooze_alarm(self, alarm: Dict) -> None:
+        self._save()
+
+    def _next_fire_epoch(self, alarm: Dict) -> float:
         """
-        Monitor a snoozed alarm until it's time to ring again.
-        
+        Compute the epoch timestamp of an alarm's next firing.
+
         Args:
-            alarm: The snoozed alarm to monitor
+            alarm: Alarm dictionary with a 'time' field in HH:MM format
+
+        Returns:
+            float: Epoch seconds of the next occurrence (today or tomorrow)
         """
-        target_time = datetime.datetime.strptime(alarm['time'], "%H:%M").time()
-        
-        while self.running:
-            current_time = datetime.datetime.now().time()
-            
-            if (current_time.hour == target_time.hour and 
-                current_time.minute == target_time.minute):
-                
-                self.play_alarm(alarm)
-                self.handle_alarm_response(alarm)
-                break
-                
-            time.sleep(30)  # Check every 30 seconds
-    
-    def start_monitoring(self) -> None:
-        """Start monitoring all alarms in a separate thread."""
-        monitor_thread = threading.Thread(target=self.alarm_monitor, daemon=True)
-        monitor_thread.start()
-        print("✅ Alarm monitoring started.")
-    
-    def alarm_monitor(self) -> None:
-        """Monitor all alarms for activation."""
-        while self.running:
-            current_time = datetime.datetime.now().time()
-            
-            for alarm in self.alarms:
-                if not alarm['enabled'] or alarm['snoozed']:
-                    continue
-                
-                alarm_time = datetime.datetime.strptime(alarm['time'], "%H:%M").time()
-                
-                if (current_time.hour == alarm_time.hour and 
-                    current_time.minute == alarm_time.minute and
-                    not self.active_alarm):
-                    
-                    self.play_alarm(alarm)
-                    self.handle_alarm_response(alarm)
-            
-            time.sleep(30)  # Check every 30 seconds
+        hours, minutes = alarm['_hm']
+        today = datetime.date.today()
+        epoch = datetime.datetime.combine(today,
+                                          datetime.time(hours, minutes)).timestamp()
+        if epoch <= time.time():
+            # Recombine on tomorrow's date rather than adding 86400s so
+            # the wall-clock time survives DST transitions
+            tomorrow = today + datetime.timedelta(days=1)
+            epoch = datetime.datetime.combine(tomorrow,
+                                              datetime.time(hours, minutes)).timestamp()
+        return epoch
+
+    def _schedule(self, alarm: Dict) -> None:
+        """
+        Push an alarm's next firing onto the scheduler heap.
+
+        Args:
+            alarm: The alarm to schedule
+        """
+        epoch = self._next_fire_epoch(alarm)
+        alarm['_next_fire'] = epoch
+        heapq.heappush(self._heap, (epoch, alarm['id']))
+
+    def _entry_alarm(self, entry: tuple) -> Optional[Dict]:
+        """
+        Resolve a heap entry to its live alarm.
+
+        Args:
+            entry: A (epoch, alarm_id) tuple from the heap
+
+        Returns:
+            Optional[Dict]: The alarm if the entry is still current,
+            None if it was deleted, disabled, or rescheduled
+        """
+        epoch, alarm_id = entry
+        alarm = self._alarms_by_id.get(alarm_id)
+        if alarm is None or not alarm['enabled']:
+            return None
+        if alarm.get('_next_fire') != epoch:
+            return None
+        return alarm
+
+    def _seconds_until_next(self) -> Optional[float]:
+        """
+        Compute the wait until the earliest live deadline.
+
+        Returns:
+            Optional[float]: Seconds until the next alarm fires, or None
+            if nothing is scheduled
+        """
+        # Lazily discard tombstoned entries at the head of the heap
+        while self._heap and self._entry_alarm(self._heap[0]) is None:
+            heapq.heappop(self._heap)
+
+        if not self._heap:
+            return None
+        return max(self._heap[0][0] - time.time(), 0)
+
+    def _fire_due(self) -> None:
+        """Fire every alarm whose deadline has passed."""
+        now = time.time()
+
+        # Drain every entry that is already due so simultaneous alarms
+        # ring together instead of the second one missing its minute
+        due: List[Dict] = []
+        while self._heap and self._heap[0][0] <= now:
+            alarm = self._entry_alarm(heapq.heappop(self._heap))
+            if alarm is not None:
+                # Clear the deadline so a duplicate entry with the same
+                # epoch (disable/re-enable on the same day) is seen as
+                # stale instead of firing the alarm twice
+                alarm.pop('_next_fire', None)
+                due.append(alarm)
+
+        if due:
+            self._fire_alarms(due)
+
+    def _fire_alarms(self, alarms: List[Dict]) -> None:
+        """
+        Ring a group of alarms that came due together as one playback.
+
+        Args:
+            alarms: Alarms that reached their deadline at the same time
+        """
+        if len(alarms) == 1:
+            ringing = alarms[0]
+        else:
+            # Coalesce into a single ring with the labels joined
+            ringing = alarms[0].copy()
+            ringing['label'] = " + ".join(alarm['label'] for alarm in alarms)
+
+        self.play_alarm(ringing)
+        self.handle_alarm_response(alarms)
+
+        for alarm in alarms:
+            # Re-arm for tomorrow unless the alarm was snoozed or disabled
+            if alarm['enabled'] and not alarm['snoozed']:
+                self._schedule(alarm)
     
     def show_help(self) -> None:
         """Display help information."""
@@ -442,42 +645,89 @@ class AlarmClock:
         
         ===============================================
         """
-        print(help_text)
+        sys.stdout.write(help_text)
     
     def display_menu(self) -> None:
         """Display the main menu."""
-        print("\n" + "="*50)
-        print("           ALARM CLOCK MENU")
-        print("="*50)
-        print("1. Set New Alarm")
-        print("2. View All Alarms")
-        print("3. Manage Alarms")
-        print("4. Help")
-        print("5. Exit")
-        print("="*50)
-        
-        # Show current time
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
-        print(f"Current Time: {current_time}")
-        
-        # Show active alarms count
-        active_count = sum(1 for alarm in self.alarms if alarm['enabled'])
-        print(f"Active Alarms: {active_count}")
+        # Show current time (integer formatting avoids strftime's parser)
+        now = time.localtime()
+
+        # One write syscall for the whole menu
+        sys.stdout.write('\n'.join([
+            "\n" + "="*50,
+            "           ALARM CLOCK MENU",
+            "="*50,
+            "1. Set New Alarm",
+            "2. View All Alarms",
+            "3. Manage Alarms",
+            "4. Help",
+            "5. Exit",
+            "="*50,
+            f"Current Time: {now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}",
+            f"Active Alarms: {self._active_count}",
+        ]) + '\n')
     
+    def _menu_input(self, prompt: str) -> Optional[str]:
+        """
+        Wait for a menu line while keeping alarm deadlines serviced.
+
+        Args:
+            prompt: Prompt to display
+
+        Returns:
+            Optional[str]: The stripped input line, or None if an alarm
+            fired first and the menu should be redrawn
+        """
+        print(prompt, end='', flush=True)
+
+        if os.name == 'nt':
+            # select() can't watch the Windows console; poll the keyboard
+            # buffer until a line arrives or the next deadline passes
+            import msvcrt
+            timeout = self._seconds_until_next()
+            deadline = None if timeout is None else time.time() + timeout
+            chars = []
+            while deadline is None or time.time() < deadline:
+                if msvcrt.kbhit():
+                    char = msvcrt.getwche()
+                    if char in ('\r', '\n'):
+                        print()
+                        return ''.join(chars).strip()
+                    chars.append(char)
+                else:
+                    time.sleep(0.05)
+            print()
+            self._fire_due()
+            return None
+
+        ready, _, _ = select.select([sys.stdin], [], [],
+                                    self._seconds_until_next())
+        if ready:
+            return sys.stdin.readline().strip()
+
+        # Deadline reached before any input arrived
+        print()
+        self._fire_due()
+        return None
+
     def run(self) -> None:
         """Main program loop."""
         print("🔔 Welcome to Advanced Alarm Clock!")
-        print("Setting up alarm monitoring...")
-        
-        # Start alarm monitoring
-        self.start_monitoring()
-        
+        print("✅ Alarm monitoring started.")
+
         while self.running:
             try:
+                # Service anything that came due while input blocked; on
+                # Windows _menu_input can't select on the console, so this
+                # is the only place its alarms fire
+                self._fire_due()
+
                 self.display_menu()
-                choice = input("\nEnter your choice (1-5): ").strip()
-                
-                if choice == '1':
+                choice = self._menu_input("\nEnter your choice (1-5): ")
+
+                if choice is None:
+                    continue  # an alarm rang; redraw the menu
+                elif choice == '1':
                     self.set_alarm()
                 elif choice == '2':
                     self.view_alarms()
@@ -491,11 +741,11 @@ class AlarmClock:
                     break
                 else:
                     print("❌ Invalid choice. Please select 1-5.")
-                    
-                # Pause before showing menu again
+
+                # Pause before showing menu again, still servicing alarms
                 if choice != '5':
-                    input("\nPress Enter to continue...")
-                    
+                    self._menu_input("\nPress Enter to continue...")
+
             except KeyboardInterrupt:
                 print("\n\n🛑 Program interrupted by user.")
                 self.running = False